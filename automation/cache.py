@@ -0,0 +1,96 @@
+"""
+Persistent response cache for Gemini prompts.
+
+Most area prompts change little (or not at all) week-to-week, so repeat
+runs can reuse prior responses instead of paying for a fresh LLM call.
+Lookups happen in two tiers:
+
+    1. Exact match on sha256(prompt) - free, catches identical prompts.
+    2. Semantic match - cosine similarity >= 0.95 between the prompt's
+       embedding and cached embeddings catches near-identical prompts.
+
+Entries expire after a TTL (default 7 days) so every area still gets a
+fresh fetch eventually. The cache lives in data/.llm_cache.json.
+"""
+
+import hashlib
+import json
+import math
+import time
+from pathlib import Path
+from typing import List, Optional
+
+CACHE_PATH = Path(__file__).parent.parent / "data" / ".llm_cache.json"
+SIMILARITY_THRESHOLD = 0.95
+TTL_SECONDS = 7 * 24 * 3600  # one week
+
+
+def cache_key(prompt: str) -> str:
+    """Stable key for exact-match lookups."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity between two embedding vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class LLMCache:
+    """Prompt -> response cache with exact and semantic lookup tiers."""
+
+    def __init__(self, path: Path = CACHE_PATH, ttl: float = TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.entries: dict = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self._load()
+
+    def _load(self) -> None:
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    self.entries = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.entries = {}
+
+    def _is_fresh(self, entry: dict) -> bool:
+        return (time.time() - entry.get("ts", 0)) < self.ttl
+
+    def get_exact(self, prompt: str) -> Optional[dict]:
+        """Return cached response for an identical prompt, if fresh."""
+        entry = self.entries.get(cache_key(prompt))
+        if entry and self._is_fresh(entry):
+            self.stats["hits"] += 1
+            return entry["response"]
+        return None
+
+    def get_semantic(self, embedding: List[float]) -> Optional[dict]:
+        """Return cached response for a semantically equivalent prompt."""
+        for entry in self.entries.values():
+            if not self._is_fresh(entry) or not entry.get("embedding"):
+                continue
+            if _cosine_similarity(embedding, entry["embedding"]) >= SIMILARITY_THRESHOLD:
+                self.stats["hits"] += 1
+                return entry["response"]
+        return None
+
+    def put(self, prompt: str, embedding: Optional[List[float]], response: dict) -> None:
+        """Store a fresh response for a prompt."""
+        self.stats["misses"] += 1
+        self.entries[cache_key(prompt)] = {
+            "embedding": embedding,
+            "response": response,
+            "ts": time.time(),
+        }
+
+    def save(self) -> None:
+        """Persist the cache, dropping expired entries."""
+        fresh = {k: v for k, v in self.entries.items() if self._is_fresh(v)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(fresh, f)
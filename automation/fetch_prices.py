@@ -18,18 +18,31 @@ Environment:
 """
 
 import os
+import gzip
 import json
 import re
 import argparse
-from datetime import datetime, timezone
+import asyncio
+import random
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional, List
 import time
 
 import google.generativeai as genai
+import numpy as np
 from dotenv import load_dotenv
+from google.api_core import exceptions as api_exceptions
+
+# Optional JIT acceleration for the haversine kernel - pure NumPy is the
+# fallback, so numba stays an opt-in extra rather than a hard dependency
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from schema import validate_price_data, PriceData
+from cache import LLMCache, cache_key
 
 # Load environment variables
 load_dotenv()
@@ -37,115 +50,231 @@ load_dotenv()
 # Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 OUTPUT_PATH = Path(__file__).parent.parent / "data" / "prices.json"
+PARQUET_PATH = OUTPUT_PATH.parent / "prices.parquet"
 MODEL_NAME = "gemini-1.5-flash"
+EMBEDDING_MODEL = "models/text-embedding-004"
+
+# Precompiled patterns for response parsing (avoids re-parse per call)
+_RE_FENCE_OPEN = re.compile(r"^```(?:json)?\n?")
+_RE_FENCE_CLOSE = re.compile(r"\n?```$")
 
 # Rate limiting - Gemini free tier: 15 RPM
 REQUESTS_PER_MINUTE = 15
-DELAY_BETWEEN_REQUESTS = 60 / REQUESTS_PER_MINUTE + 0.5  # ~4.5 seconds
+MAX_CONCURRENT_REQUESTS = 15
+
+# Areas packed into one prompt - the rules block is shared, so one
+# request (and one rate-limit token) covers BATCH_SIZE areas
+BATCH_SIZE = 8
+
+# Transient Gemini failures worth retrying - 429s are routine at the
+# free-tier limit, 5xx happen under load. Bad prompts are not retried.
+MAX_RETRIES = 3
+_RETRYABLE_ERRORS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.InternalServerError,
+    api_exceptions.DeadlineExceeded,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AreaRec:
+    """Immutable area record.
+
+    Frozen slots keep each record at ~56 bytes vs ~232 for a dict, and
+    attribute access skips the per-field hash lookup.
+    """
+    id: str
+    name: str
+    region: str
+    lat: float
+    lng: float
+    zoom_level: str
+
 
 # Mumbai areas - Updated Monday Morning (6 AM IST)
-MUMBAI_AREAS = [
+MUMBAI_AREAS: tuple = (
     # South Mumbai
-    {"id": "mum-churchgate", "name": "Churchgate", "region": "Mumbai", "lat": 18.9322, "lng": 72.8264, "zoom_level": "area"},
-    {"id": "mum-marinedrive", "name": "Marine Drive", "region": "Mumbai", "lat": 18.9432, "lng": 72.8235, "zoom_level": "area"},
-    {"id": "mum-colaba", "name": "Colaba", "region": "Mumbai", "lat": 18.9067, "lng": 72.8147, "zoom_level": "area"},
-    {"id": "mum-fortarea", "name": "Fort", "region": "Mumbai", "lat": 18.9318, "lng": 72.8352, "zoom_level": "area"},
-    {"id": "mum-nariman", "name": "Nariman Point", "region": "Mumbai", "lat": 18.9254, "lng": 72.8242, "zoom_level": "area"},
-    {"id": "mum-malabarhill", "name": "Malabar Hill", "region": "Mumbai", "lat": 18.9550, "lng": 72.7975, "zoom_level": "area"},
-    {"id": "mum-worli", "name": "Worli", "region": "Mumbai", "lat": 19.0176, "lng": 72.8150, "zoom_level": "area"},
-    {"id": "mum-lowerparel", "name": "Lower Parel", "region": "Mumbai", "lat": 18.9980, "lng": 72.8302, "zoom_level": "area"},
-    {"id": "mum-prabhadevi", "name": "Prabhadevi", "region": "Mumbai", "lat": 19.0166, "lng": 72.8285, "zoom_level": "area"},
+    AreaRec("mum-churchgate", "Churchgate", "Mumbai", 18.9322, 72.8264, "area"),
+    AreaRec("mum-marinedrive", "Marine Drive", "Mumbai", 18.9432, 72.8235, "area"),
+    AreaRec("mum-colaba", "Colaba", "Mumbai", 18.9067, 72.8147, "area"),
+    AreaRec("mum-fortarea", "Fort", "Mumbai", 18.9318, 72.8352, "area"),
+    AreaRec("mum-nariman", "Nariman Point", "Mumbai", 18.9254, 72.8242, "area"),
+    AreaRec("mum-malabarhill", "Malabar Hill", "Mumbai", 18.9550, 72.7975, "area"),
+    AreaRec("mum-worli", "Worli", "Mumbai", 19.0176, 72.8150, "area"),
+    AreaRec("mum-lowerparel", "Lower Parel", "Mumbai", 18.9980, 72.8302, "area"),
+    AreaRec("mum-prabhadevi", "Prabhadevi", "Mumbai", 19.0166, 72.8285, "area"),
     # Central Mumbai
-    {"id": "mum-dadar", "name": "Dadar", "region": "Mumbai", "lat": 19.0178, "lng": 72.8478, "zoom_level": "area"},
-    {"id": "mum-matunga", "name": "Matunga", "region": "Mumbai", "lat": 19.0275, "lng": 72.8517, "zoom_level": "area"},
-    {"id": "mum-sion", "name": "Sion", "region": "Mumbai", "lat": 19.0400, "lng": 72.8620, "zoom_level": "area"},
-    {"id": "mum-wadala", "name": "Wadala", "region": "Mumbai", "lat": 19.0177, "lng": 72.8674, "zoom_level": "area"},
-    {"id": "mum-kurla", "name": "Kurla", "region": "Mumbai", "lat": 19.0726, "lng": 72.8793, "zoom_level": "area"},
-    {"id": "mum-chembur", "name": "Chembur", "region": "Mumbai", "lat": 19.0620, "lng": 72.8960, "zoom_level": "area"},
+    AreaRec("mum-dadar", "Dadar", "Mumbai", 19.0178, 72.8478, "area"),
+    AreaRec("mum-matunga", "Matunga", "Mumbai", 19.0275, 72.8517, "area"),
+    AreaRec("mum-sion", "Sion", "Mumbai", 19.0400, 72.8620, "area"),
+    AreaRec("mum-wadala", "Wadala", "Mumbai", 19.0177, 72.8674, "area"),
+    AreaRec("mum-kurla", "Kurla", "Mumbai", 19.0726, 72.8793, "area"),
+    AreaRec("mum-chembur", "Chembur", "Mumbai", 19.0620, 72.8960, "area"),
     # Eastern Suburbs
-    {"id": "mum-ghatkopar", "name": "Ghatkopar", "region": "Mumbai", "lat": 19.0865, "lng": 72.9080, "zoom_level": "area"},
-    {"id": "mum-vikhroli", "name": "Vikhroli", "region": "Mumbai", "lat": 19.1100, "lng": 72.9280, "zoom_level": "area"},
-    {"id": "mum-kanjurmarg", "name": "Kanjurmarg", "region": "Mumbai", "lat": 19.1310, "lng": 72.9340, "zoom_level": "area"},
-    {"id": "mum-bhandup", "name": "Bhandup", "region": "Mumbai", "lat": 19.1480, "lng": 72.9380, "zoom_level": "area"},
-    {"id": "mum-mulund", "name": "Mulund", "region": "Mumbai", "lat": 19.1726, "lng": 72.9565, "zoom_level": "area"},
-    {"id": "mum-powai", "name": "Powai", "region": "Mumbai", "lat": 19.1176, "lng": 72.9060, "zoom_level": "area"},
+    AreaRec("mum-ghatkopar", "Ghatkopar", "Mumbai", 19.0865, 72.9080, "area"),
+    AreaRec("mum-vikhroli", "Vikhroli", "Mumbai", 19.1100, 72.9280, "area"),
+    AreaRec("mum-kanjurmarg", "Kanjurmarg", "Mumbai", 19.1310, 72.9340, "area"),
+    AreaRec("mum-bhandup", "Bhandup", "Mumbai", 19.1480, 72.9380, "area"),
+    AreaRec("mum-mulund", "Mulund", "Mumbai", 19.1726, 72.9565, "area"),
+    AreaRec("mum-powai", "Powai", "Mumbai", 19.1176, 72.9060, "area"),
     # Western Suburbs - Bandra to Andheri
-    {"id": "mum-mahim", "name": "Mahim", "region": "Mumbai", "lat": 19.0360, "lng": 72.8402, "zoom_level": "area"},
-    {"id": "bandra", "name": "Bandra", "region": "Mumbai", "lat": 19.0596, "lng": 72.8295, "zoom_level": "area"},
-    {"id": "mum-khar", "name": "Khar", "region": "Mumbai", "lat": 19.0710, "lng": 72.8360, "zoom_level": "area"},
-    {"id": "mum-santacruz", "name": "Santacruz", "region": "Mumbai", "lat": 19.0830, "lng": 72.8410, "zoom_level": "area"},
-    {"id": "mum-vileparle", "name": "Vile Parle", "region": "Mumbai", "lat": 19.0990, "lng": 72.8440, "zoom_level": "area"},
-    {"id": "andheri-west", "name": "Andheri West", "region": "Mumbai", "lat": 19.1364, "lng": 72.8296, "zoom_level": "area"},
-    {"id": "andheri-east", "name": "Andheri East", "region": "Mumbai", "lat": 19.1197, "lng": 72.8684, "zoom_level": "area"},
-    {"id": "mum-juhu", "name": "Juhu", "region": "Mumbai", "lat": 19.1075, "lng": 72.8263, "zoom_level": "area"},
-    {"id": "mum-versova", "name": "Versova", "region": "Mumbai", "lat": 19.1300, "lng": 72.8120, "zoom_level": "area"},
-    {"id": "mum-lokhandwala", "name": "Lokhandwala", "region": "Mumbai", "lat": 19.1410, "lng": 72.8320, "zoom_level": "area"},
+    AreaRec("mum-mahim", "Mahim", "Mumbai", 19.0360, 72.8402, "area"),
+    AreaRec("bandra", "Bandra", "Mumbai", 19.0596, 72.8295, "area"),
+    AreaRec("mum-khar", "Khar", "Mumbai", 19.0710, 72.8360, "area"),
+    AreaRec("mum-santacruz", "Santacruz", "Mumbai", 19.0830, 72.8410, "area"),
+    AreaRec("mum-vileparle", "Vile Parle", "Mumbai", 19.0990, 72.8440, "area"),
+    AreaRec("andheri-west", "Andheri West", "Mumbai", 19.1364, 72.8296, "area"),
+    AreaRec("andheri-east", "Andheri East", "Mumbai", 19.1197, 72.8684, "area"),
+    AreaRec("mum-juhu", "Juhu", "Mumbai", 19.1075, 72.8263, "area"),
+    AreaRec("mum-versova", "Versova", "Mumbai", 19.1300, 72.8120, "area"),
+    AreaRec("mum-lokhandwala", "Lokhandwala", "Mumbai", 19.1410, 72.8320, "area"),
     # Western Suburbs - Goregaon to Dahisar
-    {"id": "mum-jogeshwari", "name": "Jogeshwari", "region": "Mumbai", "lat": 19.1360, "lng": 72.8490, "zoom_level": "area"},
-    {"id": "goregaon-west", "name": "Goregaon", "region": "Mumbai", "lat": 19.1663, "lng": 72.8526, "zoom_level": "area"},
-    {"id": "malad-west", "name": "Malad", "region": "Mumbai", "lat": 19.1870, "lng": 72.8485, "zoom_level": "area"},
-    {"id": "kandivali-west", "name": "Kandivali", "region": "Mumbai", "lat": 19.2040, "lng": 72.8520, "zoom_level": "area"},
-    {"id": "borivali-west", "name": "Borivali", "region": "Mumbai", "lat": 19.2307, "lng": 72.8567, "zoom_level": "area"},
-    {"id": "mum-dahisar", "name": "Dahisar", "region": "Mumbai", "lat": 19.2590, "lng": 72.8610, "zoom_level": "area"},
+    AreaRec("mum-jogeshwari", "Jogeshwari", "Mumbai", 19.1360, 72.8490, "area"),
+    AreaRec("goregaon-west", "Goregaon", "Mumbai", 19.1663, 72.8526, "area"),
+    AreaRec("malad-west", "Malad", "Mumbai", 19.1870, 72.8485, "area"),
+    AreaRec("kandivali-west", "Kandivali", "Mumbai", 19.2040, 72.8520, "area"),
+    AreaRec("borivali-west", "Borivali", "Mumbai", 19.2307, 72.8567, "area"),
+    AreaRec("mum-dahisar", "Dahisar", "Mumbai", 19.2590, 72.8610, "area"),
     # Extended Western Line
-    {"id": "mum-miraroad", "name": "Mira Road", "region": "Mumbai", "lat": 19.2870, "lng": 72.8720, "zoom_level": "area"},
-    {"id": "mum-bhayander", "name": "Bhayandar", "region": "Mumbai", "lat": 19.3010, "lng": 72.8510, "zoom_level": "area"},
-    {"id": "mum-vasai", "name": "Vasai", "region": "Mumbai", "lat": 19.3920, "lng": 72.8280, "zoom_level": "area"},
-    {"id": "mum-virar", "name": "Virar", "region": "Mumbai", "lat": 19.4550, "lng": 72.8110, "zoom_level": "area"},
+    AreaRec("mum-miraroad", "Mira Road", "Mumbai", 19.2870, 72.8720, "area"),
+    AreaRec("mum-bhayander", "Bhayandar", "Mumbai", 19.3010, 72.8510, "area"),
+    AreaRec("mum-vasai", "Vasai", "Mumbai", 19.3920, 72.8280, "area"),
+    AreaRec("mum-virar", "Virar", "Mumbai", 19.4550, 72.8110, "area"),
     # Thane
-    {"id": "thane-west", "name": "Thane West", "region": "Thane", "lat": 19.2183, "lng": 72.9781, "zoom_level": "area"},
-    {"id": "thane-east", "name": "Thane East", "region": "Thane", "lat": 19.1860, "lng": 72.9756, "zoom_level": "area"},
-    {"id": "ghodbunder", "name": "Ghodbunder Road", "region": "Thane", "lat": 19.2560, "lng": 72.9670, "zoom_level": "area"},
+    AreaRec("thane-west", "Thane West", "Thane", 19.2183, 72.9781, "area"),
+    AreaRec("thane-east", "Thane East", "Thane", 19.1860, 72.9756, "area"),
+    AreaRec("ghodbunder", "Ghodbunder Road", "Thane", 19.2560, 72.9670, "area"),
     # Navi Mumbai
-    {"id": "navi-mumbai-vashi", "name": "Vashi", "region": "Navi Mumbai", "lat": 19.0771, "lng": 72.9986, "zoom_level": "area"},
-    {"id": "kharghar", "name": "Kharghar", "region": "Navi Mumbai", "lat": 19.0474, "lng": 73.0699, "zoom_level": "area"},
-    {"id": "panvel", "name": "Panvel", "region": "Navi Mumbai", "lat": 18.9894, "lng": 73.1175, "zoom_level": "area"},
-    {"id": "airoli", "name": "Airoli", "region": "Navi Mumbai", "lat": 19.1550, "lng": 72.9983, "zoom_level": "area"},
-    {"id": "belapur", "name": "CBD Belapur", "region": "Navi Mumbai", "lat": 19.0235, "lng": 73.0391, "zoom_level": "area"},
-    {"id": "nerul", "name": "Nerul", "region": "Navi Mumbai", "lat": 19.0330, "lng": 73.0160, "zoom_level": "area"},
+    AreaRec("navi-mumbai-vashi", "Vashi", "Navi Mumbai", 19.0771, 72.9986, "area"),
+    AreaRec("kharghar", "Kharghar", "Navi Mumbai", 19.0474, 73.0699, "area"),
+    AreaRec("panvel", "Panvel", "Navi Mumbai", 18.9894, 73.1175, "area"),
+    AreaRec("airoli", "Airoli", "Navi Mumbai", 19.1550, 72.9983, "area"),
+    AreaRec("belapur", "CBD Belapur", "Navi Mumbai", 19.0235, 73.0391, "area"),
+    AreaRec("nerul", "Nerul", "Navi Mumbai", 19.0330, 73.0160, "area"),
     # Bhiwandi
-    {"id": "bhiwandi-kalher", "name": "Kalher", "region": "Bhiwandi", "lat": 19.2473, "lng": 73.0178, "zoom_level": "area"},
-    {"id": "bhiwandi-anjur", "name": "Anjur", "region": "Bhiwandi", "lat": 19.2750, "lng": 73.0280, "zoom_level": "area"},
-    {"id": "bhiwandi-kasheli", "name": "Kasheli", "region": "Bhiwandi", "lat": 19.2360, "lng": 73.0146, "zoom_level": "area"},
-]
+    AreaRec("bhiwandi-kalher", "Kalher", "Bhiwandi", 19.2473, 73.0178, "area"),
+    AreaRec("bhiwandi-anjur", "Anjur", "Bhiwandi", 19.2750, 73.0280, "area"),
+    AreaRec("bhiwandi-kasheli", "Kasheli", "Bhiwandi", 19.2360, 73.0146, "area"),
+)
 
 # Pune areas - Updated Monday Evening (6 PM IST)
-PUNE_AREAS = [
+PUNE_AREAS: tuple = (
     # Core Pune
-    {"id": "pune-kothrud", "name": "Kothrud", "region": "Pune", "lat": 18.5074, "lng": 73.8077, "zoom_level": "area"},
-    {"id": "pune-deccan", "name": "Deccan", "region": "Pune", "lat": 18.5170, "lng": 73.8400, "zoom_level": "area"},
-    {"id": "pune-shivaji", "name": "Shivajinagar", "region": "Pune", "lat": 18.5308, "lng": 73.8475, "zoom_level": "area"},
-    {"id": "pune-camp", "name": "Camp", "region": "Pune", "lat": 18.5140, "lng": 73.8800, "zoom_level": "area"},
+    AreaRec("pune-kothrud", "Kothrud", "Pune", 18.5074, 73.8077, "area"),
+    AreaRec("pune-deccan", "Deccan", "Pune", 18.5170, 73.8400, "area"),
+    AreaRec("pune-shivaji", "Shivajinagar", "Pune", 18.5308, 73.8475, "area"),
+    AreaRec("pune-camp", "Camp", "Pune", 18.5140, 73.8800, "area"),
     # IT Corridor (West)
-    {"id": "pune-baner", "name": "Baner", "region": "Pune", "lat": 18.5590, "lng": 73.7868, "zoom_level": "area"},
-    {"id": "pune-balewadi", "name": "Balewadi", "region": "Pune", "lat": 18.5726, "lng": 73.7698, "zoom_level": "area"},
-    {"id": "pune-wakad", "name": "Wakad", "region": "Pune", "lat": 18.5980, "lng": 73.7640, "zoom_level": "area"},
-    {"id": "pune-hinjewadi", "name": "Hinjewadi", "region": "Pune", "lat": 18.5912, "lng": 73.7380, "zoom_level": "area"},
-    {"id": "pune-tathawade", "name": "Tathawade", "region": "Pune", "lat": 18.6140, "lng": 73.7550, "zoom_level": "area"},
-    {"id": "pune-aundh", "name": "Aundh", "region": "Pune", "lat": 18.5580, "lng": 73.8070, "zoom_level": "area"},
-    {"id": "pune-pashan", "name": "Pashan", "region": "Pune", "lat": 18.5330, "lng": 73.7880, "zoom_level": "area"},
-    {"id": "pune-bavdhan", "name": "Bavdhan", "region": "Pune", "lat": 18.5120, "lng": 73.7690, "zoom_level": "area"},
+    AreaRec("pune-baner", "Baner", "Pune", 18.5590, 73.7868, "area"),
+    AreaRec("pune-balewadi", "Balewadi", "Pune", 18.5726, 73.7698, "area"),
+    AreaRec("pune-wakad", "Wakad", "Pune", 18.5980, 73.7640, "area"),
+    AreaRec("pune-hinjewadi", "Hinjewadi", "Pune", 18.5912, 73.7380, "area"),
+    AreaRec("pune-tathawade", "Tathawade", "Pune", 18.6140, 73.7550, "area"),
+    AreaRec("pune-aundh", "Aundh", "Pune", 18.5580, 73.8070, "area"),
+    AreaRec("pune-pashan", "Pashan", "Pune", 18.5330, 73.7880, "area"),
+    AreaRec("pune-bavdhan", "Bavdhan", "Pune", 18.5120, 73.7690, "area"),
     # East Pune
-    {"id": "pune-vimannagar", "name": "Viman Nagar", "region": "Pune", "lat": 18.5679, "lng": 73.9143, "zoom_level": "area"},
-    {"id": "pune-kalyani", "name": "Kalyani Nagar", "region": "Pune", "lat": 18.5462, "lng": 73.9020, "zoom_level": "area"},
-    {"id": "pune-koregaon", "name": "Koregaon Park", "region": "Pune", "lat": 18.5362, "lng": 73.8940, "zoom_level": "area"},
-    {"id": "pune-kharadi", "name": "Kharadi", "region": "Pune", "lat": 18.5530, "lng": 73.9470, "zoom_level": "area"},
-    {"id": "pune-hadapsar", "name": "Hadapsar", "region": "Pune", "lat": 18.5089, "lng": 73.9260, "zoom_level": "area"},
-    {"id": "pune-magarpatta", "name": "Magarpatta", "region": "Pune", "lat": 18.5158, "lng": 73.9280, "zoom_level": "area"},
-    {"id": "pune-wagholi", "name": "Wagholi", "region": "Pune", "lat": 18.5790, "lng": 73.9770, "zoom_level": "area"},
-    {"id": "pune-dhanori", "name": "Dhanori", "region": "Pune", "lat": 18.5880, "lng": 73.9060, "zoom_level": "area"},
+    AreaRec("pune-vimannagar", "Viman Nagar", "Pune", 18.5679, 73.9143, "area"),
+    AreaRec("pune-kalyani", "Kalyani Nagar", "Pune", 18.5462, 73.9020, "area"),
+    AreaRec("pune-koregaon", "Koregaon Park", "Pune", 18.5362, 73.8940, "area"),
+    AreaRec("pune-kharadi", "Kharadi", "Pune", 18.5530, 73.9470, "area"),
+    AreaRec("pune-hadapsar", "Hadapsar", "Pune", 18.5089, 73.9260, "area"),
+    AreaRec("pune-magarpatta", "Magarpatta", "Pune", 18.5158, 73.9280, "area"),
+    AreaRec("pune-wagholi", "Wagholi", "Pune", 18.5790, 73.9770, "area"),
+    AreaRec("pune-dhanori", "Dhanori", "Pune", 18.5880, 73.9060, "area"),
     # South Pune
-    {"id": "pune-kondhwa", "name": "Kondhwa", "region": "Pune", "lat": 18.4650, "lng": 73.8930, "zoom_level": "area"},
-    {"id": "pune-undri", "name": "Undri", "region": "Pune", "lat": 18.4580, "lng": 73.9100, "zoom_level": "area"},
-    {"id": "pune-wanowrie", "name": "Wanowrie", "region": "Pune", "lat": 18.4940, "lng": 73.8940, "zoom_level": "area"},
-    {"id": "pune-bibwewadi", "name": "Bibwewadi", "region": "Pune", "lat": 18.4830, "lng": 73.8630, "zoom_level": "area"},
-    {"id": "pune-warje", "name": "Warje", "region": "Pune", "lat": 18.4860, "lng": 73.8060, "zoom_level": "area"},
-    {"id": "pune-sinhagad", "name": "Sinhagad Road", "region": "Pune", "lat": 18.4740, "lng": 73.8220, "zoom_level": "area"},
+    AreaRec("pune-kondhwa", "Kondhwa", "Pune", 18.4650, 73.8930, "area"),
+    AreaRec("pune-undri", "Undri", "Pune", 18.4580, 73.9100, "area"),
+    AreaRec("pune-wanowrie", "Wanowrie", "Pune", 18.4940, 73.8940, "area"),
+    AreaRec("pune-bibwewadi", "Bibwewadi", "Pune", 18.4830, 73.8630, "area"),
+    AreaRec("pune-warje", "Warje", "Pune", 18.4860, 73.8060, "area"),
+    AreaRec("pune-sinhagad", "Sinhagad Road", "Pune", 18.4740, 73.8220, "area"),
     # PCMC (Pimpri-Chinchwad)
-    {"id": "pune-pimpri", "name": "Pimpri", "region": "Pune", "lat": 18.6298, "lng": 73.7997, "zoom_level": "area"},
-    {"id": "pune-chinchwad", "name": "Chinchwad", "region": "Pune", "lat": 18.6492, "lng": 73.7658, "zoom_level": "area"},
-    {"id": "pune-nigdi", "name": "Nigdi", "region": "Pune", "lat": 18.6518, "lng": 73.7708, "zoom_level": "area"},
-]
+    AreaRec("pune-pimpri", "Pimpri", "Pune", 18.6298, 73.7997, "area"),
+    AreaRec("pune-chinchwad", "Chinchwad", "Pune", 18.6492, 73.7658, "area"),
+    AreaRec("pune-nigdi", "Nigdi", "Pune", 18.6518, 73.7708, "area"),
+)
+
+# Structure-of-arrays views over all areas for vectorized geospatial ops.
+# Contiguous float64 buffers let NumPy kernels (nearest-area, bbox masks)
+# run without per-record dict lookups.
+ALL_AREAS: tuple = MUMBAI_AREAS + PUNE_AREAS
+_AREA_LAT = np.fromiter((a.lat for a in ALL_AREAS), dtype=np.float64)
+_AREA_LNG = np.fromiter((a.lng for a in ALL_AREAS), dtype=np.float64)
+_AREA_ID = np.array([a.id for a in ALL_AREAS])
+
+# Radian copies for the haversine kernel, converted once at import
+_AREA_LAT_RAD = np.radians(_AREA_LAT)
+_AREA_LNG_RAD = np.radians(_AREA_LNG)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def nearest_area(lat: float, lng: float) -> AreaRec:
+    """Find the area closest to a coordinate (squared-distance argmin)."""
+    idx = int(np.argmin((_AREA_LAT - lat) ** 2 + (_AREA_LNG - lng) ** 2))
+    return ALL_AREAS[idx]
+
+
+def _haversine_km(lat0: float, lng0: float, lats, lngs):
+    """Great-circle distances in km from one point to arrays of points.
+
+    All inputs in radians. Written as straight NumPy ufunc math so the
+    same body runs vectorized in pure NumPy or SIMD-compiled under numba.
+    """
+    sin_dlat = np.sin((lats - lat0) / 2)
+    sin_dlng = np.sin((lngs - lng0) / 2)
+    a = sin_dlat * sin_dlat + np.cos(lat0) * np.cos(lats) * sin_dlng * sin_dlng
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if njit is not None:
+    _haversine_km = njit(cache=True, fastmath=True)(_haversine_km)
+
+
+def nearest_k_areas(lat: float, lng: float, k: int = 5) -> List[AreaRec]:
+    """Return the k areas closest to a coordinate by great-circle distance."""
+    k = min(k, len(ALL_AREAS))
+    dist = _haversine_km(
+        float(np.radians(lat)), float(np.radians(lng)), _AREA_LAT_RAD, _AREA_LNG_RAD
+    )
+    # argpartition finds the k smallest in O(n); only those get sorted
+    idx = np.argpartition(dist, k - 1)[:k]
+    idx = idx[np.argsort(dist[idx])]
+    return [ALL_AREAS[i] for i in idx]
+
+
+class TokenBucket:
+    """Async token bucket that keeps requests inside the Gemini RPM quota.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Callers await acquire() before each request; if the bucket is empty
+    they sleep just long enough for the next token instead of a fixed delay.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
 
 
 def create_prompt(area_name: str, city: str = "Mumbai") -> str:
@@ -182,6 +311,79 @@ Rules:
 - No text outside the JSON object"""
 
 
+def _find_json_object(text: str) -> Optional[str]:
+    """Find the first balanced JSON object in text via a linear brace scan.
+
+    Tracks brace depth plus string/escape state in one O(n) pass - no
+    regex backtracking over multi-KB LLM output.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if escape:
+            escape = False
+        elif char == "\\":
+            escape = True
+        elif char == '"':
+            in_string = not in_string
+        elif not in_string:
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    return None
+
+
+def create_batch_prompt(area_names: List[str], city: str = "Mumbai") -> str:
+    """Create structured prompt covering several areas in one request."""
+    area_list = "\n".join(f"- {name}" for name in area_names)
+    return f"""You are a real estate data analyst. Search for current property prices in these areas of {city}, India:
+{area_list}
+
+Find approximate price ranges for BUYING and RENTING properties in each area.
+
+Return ONLY a JSON object in this exact format (no markdown, no explanation):
+{{
+    "results": [
+        {{
+            "area": "<area name exactly as listed above>",
+            "buy": {{
+                "1rk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "1bhk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "2bhk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "3bhk_plus": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}}
+            }},
+            "rent": {{
+                "1rk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "1bhk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "2bhk": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}},
+                "3bhk_plus": {{"min": <number>, "max": <number>, "confidence": "<low|medium|high>"}}
+            }}
+        }}
+    ]
+}}
+
+Rules:
+- Include one results entry per listed area, in the same order
+- All prices in INR (Indian Rupees)
+- Buy prices are total purchase prices
+- Rent prices are monthly rent
+- Confidence levels:
+  - "low": Sparse or inconsistent listings found
+  - "medium": Multiple recent listings available
+  - "high": Strong consensus across multiple sources
+- Return realistic {city} market prices for 2024-2025
+- No text outside the JSON object"""
+
+
 def extract_json_from_response(text: str) -> Optional[dict]:
     """Extract JSON object from Gemini response."""
     # Try to find JSON in the response
@@ -189,49 +391,159 @@ def extract_json_from_response(text: str) -> Optional[dict]:
     
     # Remove markdown code blocks if present
     if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?\n?", "", text)
-        text = re.sub(r"\n?```$", "", text)
-    
+        text = _RE_FENCE_OPEN.sub("", text, count=1)
+        text = _RE_FENCE_CLOSE.sub("", text, count=1)
+
     try:
         return json.loads(text)
     except json.JSONDecodeError:
         # Try to find JSON object in text
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
+        candidate = _find_json_object(text)
+        if candidate:
             try:
-                return json.loads(match.group())
+                return json.loads(candidate)
             except json.JSONDecodeError:
                 pass
     return None
 
 
-def fetch_prices_for_area(model, area: dict, city: str = "Mumbai") -> Optional[dict]:
-    """Fetch price data for a single area using Gemini."""
-    prompt = create_prompt(area["name"], city)
-    
+async def _generate_with_retry(model, prompt: str, label: str):
+    """Call Gemini with exponential backoff on transient errors.
+
+    Retries up to MAX_RETRIES times with 2^attempt + jitter sleeps so a
+    single 429/5xx no longer drops an area for the whole week. Permanent
+    errors (e.g. InvalidArgument) propagate to the caller immediately.
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return await model.generate_content_async(prompt)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            backoff = 2 ** attempt + random.random()
+            print(f"  🔁 {type(e).__name__} for {label}, retry {attempt + 1}/{MAX_RETRIES - 1} in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+
+
+# In-flight request memo - if two areas ever produce an identical prompt
+# (duplicate list entries, same name under two regions), concurrent
+# callers await the one live task instead of paying for a second call
+_INFLIGHT: dict = {}
+
+
+async def _generate_deduped(model, prompt: str, label: str):
+    """Issue a Gemini call, deduplicating identical prompts within a run."""
+    key = cache_key(prompt)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_with_retry(model, prompt, label))
+        _INFLIGHT[key] = task
+    return await task
+
+
+async def _embed_prompt(prompt: str) -> Optional[list]:
+    """Embed a prompt for semantic cache lookups; None on failure."""
     try:
-        response = model.generate_content(prompt)
+        result = await genai.embed_content_async(model=EMBEDDING_MODEL, content=prompt)
+        return result["embedding"]
+    except Exception:
+        return None
+
+
+async def fetch_prices_for_area(
+    model, area: AreaRec, city: str = "Mumbai", cache: Optional[LLMCache] = None
+) -> Optional[dict]:
+    """Fetch price data for a single area using Gemini (cache-first)."""
+    prompt = create_prompt(area.name, city)
+
+    embedding = None
+    if cache:
+        # Exact-match fast path, then semantic match on the embedding
+        prices = cache.get_exact(prompt)
+        if prices is None:
+            embedding = await _embed_prompt(prompt)
+            if embedding:
+                prices = cache.get_semantic(embedding)
+        if prices and "buy" in prices and "rent" in prices:
+            return {**asdict(area), **prices}
+
+    try:
+        response = await _generate_deduped(model, prompt, area.name)
         prices = extract_json_from_response(response.text)
-        
+
         if prices and "buy" in prices and "rent" in prices:
-            return {**area, **prices}
+            if cache:
+                cache.put(prompt, embedding, prices)
+            return {**asdict(area), **prices}
         else:
-            print(f"  ⚠️ Invalid response format for {area['name']}")
+            print(f"  ⚠️ Invalid response format for {area.name}")
             return None
-            
+
     except Exception as e:
-        print(f"  ❌ Error fetching {area['name']}: {e}")
+        print(f"  ❌ Error fetching {area.name}: {e}")
         return None
 
 
-def get_areas_for_region(region: str) -> List[dict]:
+async def fetch_prices_for_batch(
+    model, batch: List[AreaRec], city: str = "Mumbai", cache: Optional[LLMCache] = None
+) -> List[dict]:
+    """Fetch price data for a batch of areas with a single Gemini request.
+
+    The ~400-token rules block is shared across the batch, so one request
+    (and one rate-limit token) covers BATCH_SIZE areas instead of one.
+    """
+    prompt = create_batch_prompt([a.name for a in batch], city)
+
+    embedding = None
+    parsed = None
+    if cache:
+        parsed = cache.get_exact(prompt)
+        if parsed is None:
+            embedding = await _embed_prompt(prompt)
+            if embedding:
+                parsed = cache.get_semantic(embedding)
+
+    if parsed is None:
+        try:
+            response = await _generate_deduped(
+                model, prompt, f"batch of {len(batch)}"
+            )
+            parsed = extract_json_from_response(response.text)
+        except Exception as e:
+            print(f"  ❌ Error fetching batch of {len(batch)}: {e}")
+            return []
+
+        if not parsed or "results" not in parsed:
+            print(f"  ⚠️ Invalid batch response format ({len(batch)} areas)")
+            return []
+        if cache:
+            cache.put(prompt, embedding, parsed)
+
+    # Map results back onto area records by name
+    by_name = {
+        r["area"].strip().lower(): r
+        for r in parsed.get("results", [])
+        if isinstance(r, dict) and "area" in r
+    }
+
+    merged = []
+    for area in batch:
+        result = by_name.get(area.name.lower())
+        if result and "buy" in result and "rent" in result:
+            merged.append({**asdict(area), "buy": result["buy"], "rent": result["rent"]})
+        else:
+            print(f"  ⚠️ No prices in batch response for {area.name}")
+    return merged
+
+
+def get_areas_for_region(region: str) -> tuple:
     """Get area list based on region."""
     if region == "mumbai":
         return MUMBAI_AREAS
     elif region == "pune":
         return PUNE_AREAS
     elif region == "all":
-        return MUMBAI_AREAS + PUNE_AREAS
+        return ALL_AREAS
     else:
         raise ValueError(f"Unknown region: {region}")
 
@@ -253,70 +565,166 @@ def load_existing_data() -> dict:
     return {"version": "1.0.0", "areas": []}
 
 
-def merge_price_data(existing: dict, new_areas: List[dict]) -> dict:
-    """Merge new price data with existing data."""
-    # Create a map of existing areas by ID
-    existing_map = {area["id"]: area for area in existing.get("areas", [])}
-    
-    # Update with new areas
+def merge_price_data(
+    existing: dict, new_areas: List[dict], generated_at: Optional[str] = None
+) -> dict:
+    """Merge new price data into existing data in place.
+
+    Weekly runs touch a subset of areas, so instead of rebuilding the
+    whole list through an id->area dict, overwrite updated records at
+    their existing list position and append only genuinely new ids.
+    """
+    if generated_at is None:
+        generated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    areas = existing.get("areas", [])
+    position = {area["id"]: i for i, area in enumerate(areas)}
+
     for area in new_areas:
-        existing_map[area["id"]] = area
-    
+        pos = position.get(area["id"])
+        if pos is not None:
+            areas[pos] = area
+        else:
+            position[area["id"]] = len(areas)
+            areas.append(area)
+
     return {
         "version": existing.get("version", "1.0.0"),
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at,
         "disclaimer": "Prices shown are indicative bands based on recent public listings, not verified transactions.",
-        "areas": list(existing_map.values())
+        "areas": areas
     }
 
 
+async def _fetch_areas_concurrently(
+    model, areas: tuple, city: str, cache: Optional[LLMCache] = None
+) -> List[dict]:
+    """Fetch all areas concurrently, rate-limited by a shared token bucket."""
+    bucket = TokenBucket(rate=REQUESTS_PER_MINUTE / 60, capacity=REQUESTS_PER_MINUTE)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    batches = [areas[i:i + BATCH_SIZE] for i in range(0, len(areas), BATCH_SIZE)]
+    completed = 0
+
+    async def bounded_fetch(batch: List[AreaRec]) -> List[dict]:
+        nonlocal completed
+        async with semaphore:
+            await bucket.acquire()
+            results = await fetch_prices_for_batch(model, batch, city, cache=cache)
+
+        completed += len(batch)
+        print(f"[{completed}/{len(areas)}] ✅ Got prices for {len(results)}/{len(batch)} areas in batch")
+        return results
+
+    batch_results = await asyncio.gather(
+        *[bounded_fetch(batch) for batch in batches], return_exceptions=True
+    )
+    return [area for r in batch_results if isinstance(r, list) for area in r]
+
+
 def fetch_all_prices(region: str = "all") -> dict:
     """Fetch prices for specified region and merge with existing data."""
     if not GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY environment variable not set")
-    
+
     # Configure Gemini
     genai.configure(api_key=GEMINI_API_KEY)
     model = genai.GenerativeModel(MODEL_NAME)
-    
+
     areas = get_areas_for_region(region)
     city = get_city_for_region(region)
-    
+
+    # One C-level strftime instead of a datetime allocation per merge;
+    # keeps every value in the output JSON-native (no default= hook)
+    generated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
     print(f"🚀 Starting price fetch for {len(areas)} {region.upper()} areas...")
-    print(f"📅 {datetime.now(timezone.utc).isoformat()}")
-    print(f"⏱️ Rate limit: {REQUESTS_PER_MINUTE} requests/min (~{DELAY_BETWEEN_REQUESTS:.1f}s delay)\n")
-    
-    new_areas = []
-    
-    for i, area in enumerate(areas, 1):
-        print(f"[{i}/{len(areas)}] Fetching {area['name']}...")
-        
-        result = fetch_prices_for_area(model, area, city)
-        if result:
-            new_areas.append(result)
-            print(f"  ✅ Got prices for {area['name']}")
-        else:
-            print(f"  ⏭️ Skipping {area['name']} (will keep existing data)")
-        
-        # Rate limiting
-        if i < len(areas):
-            time.sleep(DELAY_BETWEEN_REQUESTS)
-    
+    print(f"📅 {generated_at}")
+    print(f"⏱️ Rate limit: {REQUESTS_PER_MINUTE} requests/min, up to {MAX_CONCURRENT_REQUESTS} concurrent\n")
+
+    cache = LLMCache()
+    new_areas = asyncio.run(_fetch_areas_concurrently(model, areas, city, cache=cache))
+    cache.save()
+
     # Load existing data and merge
     existing = load_existing_data()
-    merged = merge_price_data(existing, new_areas)
-    
+    merged = merge_price_data(existing, new_areas, generated_at)
+
     print(f"\n✅ Updated {len(new_areas)} areas, total {len(merged['areas'])} areas")
-    
+    print(f"💰 Cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses")
+
     return merged
+def build_price_frame(data: dict):
+    """Flatten price data into one row per (area, buy/rent, property type).
+
+    The columnar layout is what analytical consumers (history, heatmaps,
+    notebooks) actually want - aggregations run over typed contiguous
+    columns instead of re-walking nested JSON.
+    """
+    import pandas as pd
+
+    rows = []
+    for area in data.get("areas", []):
+        for kind in ("buy", "rent"):
+            for prop_type, band in area.get(kind, {}).items():
+                rows.append({
+                    "area_id": area["id"],
+                    "region": area["region"],
+                    "lat": area["lat"],
+                    "lng": area["lng"],
+                    "kind": kind,
+                    "type": prop_type,
+                    "min": band["min"],
+                    "max": band["max"],
+                    "confidence": band["confidence"],
+                })
+
+    df = pd.DataFrame(rows)
+    return df.astype({
+        "area_id": "category",
+        "region": "category",
+        "lat": "float32",
+        "lng": "float32",
+        "kind": "category",
+        "type": "category",
+        "min": "int64",
+        "max": "int64",
+        "confidence": "category",
+    })
+
+
+def save_parquet(data: dict) -> None:
+    """Write the analytical Parquet artifact; never fails the JSON save."""
+    try:
+        df = build_price_frame(data)
+        df.to_parquet(PARQUET_PATH, compression="zstd", index=False)
+        print(f"📦 Saved {len(df)} rows to {PARQUET_PATH.name}")
+    except Exception as e:
+        print(f"  ⚠️ Parquet export skipped: {e}")
+
+
 def save_prices(data: dict) -> None:
-    """Save price data to JSON file."""
+    """Save price data atomically, plus a gzip-precompressed copy.
+
+    Compact JSON (no indent) keeps the file ~30% smaller; writing to a
+    temp file and os.replace-ing it in means readers never see a partial
+    write. The .json.gz sibling lets the API serve pre-compressed bytes
+    with Content-Encoding: gzip instead of compressing per request.
+    """
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(data, f, indent=2, default=str)
-    
-    print(f"💾 Saved to {OUTPUT_PATH}")
+
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = OUTPUT_PATH.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, OUTPUT_PATH)
+
+    gz_path = OUTPUT_PATH.with_suffix(".json.gz")
+    with gzip.open(gz_path, "wb", compresslevel=6) as f:
+        f.write(body)
+
+    print(f"💾 Saved to {OUTPUT_PATH} (+ {gz_path.name})")
+
+    save_parquet(data)
 
 
 def main():
@@ -6,6 +6,7 @@ Intentionally minimal - no database, no auth, no business logic.
 
 Endpoints:
     GET /api/prices - Returns all price band data
+    GET /api/areas - Returns area listing without price bands
     GET /api/health - Health check
 
 Usage:
@@ -14,65 +15,198 @@ Usage:
 Server runs on http://localhost:5000
 """
 
-import json
+import hashlib
+import mmap
 from pathlib import Path
 
-from flask import Flask, jsonify
+import ijson
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend dev
 
-# Path to price data
+# Path to price data (and its precompressed sibling from save_prices)
 DATA_PATH = Path(__file__).parent.parent / "data" / "prices.json"
+GZ_PATH = DATA_PATH.with_suffix(".json.gz")
+
+# In-process cache - prices.json changes weekly, so re-reading and
+# re-parsing it on every request is pure waste. Invalidated by mtime.
+_CACHE = {
+    "mtime": 0.0,
+    "data": None,
+    "body": None,
+    "gz_body": None,
+    "etag": None,
+    "areas_lite": None,
+    "areas_lite_etag": None,
+}
+
+# Fields the map needs to render markers; price ladders are ~90% of the
+# full payload and get dropped for /api/areas
+_LITE_FIELDS = ("id", "name", "lat", "lng", "region")
+
+# Separate cache for health-check metadata so /api/health never has to
+# materialize the full areas tree.
+_META_CACHE = {"mtime": 0.0, "meta": None}
+
+_EMPTY_DATA = {
+    "version": "0.0.0",
+    "generated_at": None,
+    "disclaimer": "No data available",
+    "areas": []
+}
+
+
+def _json_response(data) -> Response:
+    """Serialize with orjson (2-5x faster than stdlib json on dicts)."""
+    return Response(orjson.dumps(data), mimetype="application/json")
 
 
 def load_prices() -> dict:
-    """Load price data from JSON file."""
+    """Load price data, re-reading the file only when its mtime changes."""
+    if not DATA_PATH.exists():
+        return _EMPTY_DATA
+
+    mtime = DATA_PATH.stat().st_mtime
+    if mtime != _CACHE["mtime"]:
+        # mmap lets orjson parse straight out of the kernel page cache
+        # instead of copying the file into a Python bytes object first
+        with open(DATA_PATH, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            data = orjson.loads(view)
+        finally:
+            view.release()
+            mm.close()
+        _CACHE["data"] = data
+        _CACHE["body"] = orjson.dumps(data)
+        _CACHE["gz_body"] = GZ_PATH.read_bytes() if GZ_PATH.exists() else None
+        _CACHE["etag"] = hashlib.blake2b(_CACHE["body"], digest_size=8).hexdigest()
+        _CACHE["areas_lite"] = orjson.dumps([
+            {k: a.get(k) for k in _LITE_FIELDS} for a in data.get("areas", [])
+        ])
+        _CACHE["areas_lite_etag"] = hashlib.blake2b(
+            _CACHE["areas_lite"], digest_size=8
+        ).hexdigest()
+        _CACHE["mtime"] = mtime
+
+    return _CACHE["data"]
+
+
+def load_meta() -> dict:
+    """Load only version, generated_at and area count via a streaming parse.
+
+    ijson walks the file in one pass without building the areas list in
+    memory, so health checks stay O(1) in allocations however large the
+    data file grows.
+    """
     if not DATA_PATH.exists():
-        return {
-            "version": "0.0.0",
-            "generated_at": None,
-            "disclaimer": "No data available",
-            "areas": []
+        return {"version": "0.0.0", "generated_at": None, "areas_count": 0}
+
+    mtime = DATA_PATH.stat().st_mtime
+    if mtime != _META_CACHE["mtime"]:
+        version = None
+        generated_at = None
+        areas_count = 0
+        with open(DATA_PATH, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "version":
+                    version = value
+                elif prefix == "generated_at":
+                    generated_at = value
+                elif prefix == "areas.item" and event == "start_map":
+                    areas_count += 1
+        _META_CACHE["meta"] = {
+            "version": version,
+            "generated_at": generated_at,
+            "areas_count": areas_count
         }
-    
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+        _META_CACHE["mtime"] = mtime
+
+    return _META_CACHE["meta"]
 
 
 @app.route("/api/prices", methods=["GET"])
 def get_prices():
     """
     Get all price band data.
-    
+
     Returns:
         JSON with version, generated_at, disclaimer, and areas array
     """
     data = load_prices()
-    return jsonify(data)
+    if _CACHE["body"] is None:
+        return _json_response(data)
+
+    # Conditional GET: data changes weekly, so repeat polls usually match
+    cache_headers = {
+        "ETag": _CACHE["etag"],
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding"
+    }
+    if request.headers.get("If-None-Match") == _CACHE["etag"]:
+        return Response(status=304, headers=cache_headers)
+
+    # Serve pre-compressed bytes when the client accepts gzip (~5x smaller)
+    if _CACHE["gz_body"] and "gzip" in request.headers.get("Accept-Encoding", ""):
+        return Response(
+            _CACHE["gz_body"],
+            mimetype="application/json",
+            headers={**cache_headers, "Content-Encoding": "gzip"}
+        )
+
+    # Serve the pre-serialized bytes; skips re-encoding entirely
+    return Response(_CACHE["body"], mimetype="application/json", headers=cache_headers)
+
+
+@app.route("/api/areas", methods=["GET"])
+def get_areas():
+    """
+    Get the area listing without price bands.
+
+    Returns:
+        JSON array of {id, name, lat, lng, region} - enough to render
+        map markers at ~10% of the full payload size
+    """
+    data = load_prices()
+    if _CACHE["areas_lite"] is None:
+        return _json_response([
+            {k: a.get(k) for k in _LITE_FIELDS} for a in data.get("areas", [])
+        ])
+
+    headers = {
+        "ETag": _CACHE["areas_lite_etag"],
+        "Cache-Control": "public, max-age=3600"
+    }
+    if request.headers.get("If-None-Match") == _CACHE["areas_lite_etag"]:
+        return Response(status=304, headers=headers)
+    return Response(_CACHE["areas_lite"], mimetype="application/json", headers=headers)
 
 
 @app.route("/api/health", methods=["GET"])
 def health():
     """Health check endpoint."""
-    data = load_prices()
-    return jsonify({
+    meta = load_meta()
+    return _json_response({
         "status": "healthy",
-        "version": data.get("version", "unknown"),
-        "areas_count": len(data.get("areas", [])),
-        "generated_at": data.get("generated_at")
+        "version": meta.get("version") or "unknown",
+        "areas_count": meta["areas_count"],
+        "generated_at": meta["generated_at"]
     })
 
 
 @app.route("/", methods=["GET"])
 def root():
     """Root endpoint with API info."""
-    return jsonify({
+    return _json_response({
         "name": "Urban Price Radar API",
         "version": "1.0.0",
         "endpoints": {
             "/api/prices": "GET - Returns all price band data",
+            "/api/areas": "GET - Returns area listing without price bands",
             "/api/health": "GET - Health check"
         },
         "disclaimer": "Prices shown are indicative bands based on recent public listings, not verified transactions."
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for the Urban Price Radar API.
+
+Threaded workers suit this app: requests are dominated by serving
+cached bytes, so threads overlap I/O while workers use all cores.
+preload_app loads the app (and its in-memory price cache) once in the
+master so workers share the pages copy-on-write.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = os.cpu_count() or 2
+threads = 4
+worker_class = "gthread"
+preload_app = True
+timeout = 30
+accesslog = "-"
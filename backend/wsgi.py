@@ -0,0 +1,10 @@
+"""
+WSGI entrypoint for production servers.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import app
+
+__all__ = ["app"]